@@ -1,8 +1,163 @@
+import math
 from sys import argv
+from types import MappingProxyType
 from typing import Iterable, Union
 
 import numpy as np
 
+# Oort groups in the order used to index the parameter arrays below
+OORT_GROUPS = ("new", "int", "old")
+ORBITAL_ARCS = ("inbound", "outbound")
+
+
+def _freeze(mapping: dict) -> MappingProxyType:
+    """Return a read-only view of a nested dictionary."""
+    return MappingProxyType(
+        {k: _freeze(v) if isinstance(v, dict) else v for k, v in mapping.items()}
+    )
+
+
+# median brightening parameters, by Oort group and orbital arc (read-only)
+BRIGHTENING_PARS = _freeze(
+    {
+        "new": {
+            "inbound": {
+                "k_near": 6.7285,  # Near-Sun slope
+                "k_far": 12.847,  # Far-Sun slope
+                "m1": 8.28,  # Pre-perihelion magnitude at 1 au
+            },
+            "outbound": {
+                "k1": 11.54,  # Post-perihelion fading slope
+                "m1": 8.75,  # Post-perihelion magnitude at 1 au
+            },
+        },
+        "int": {
+            "inbound": {"k_near": 7.83575, "k_far": 12.524, "m1": 8.96},
+            "outbound": {"k1": 12.66, "m1": 9.71},
+        },
+        "old": {
+            "inbound": {"k_near": 13.40275, "k_far": 14.632, "m1": 11.58},
+            "outbound": {"k1": 13.21, "m1": 11.57},
+        },
+    }
+)
+
+# distance at which slope changes
+TRANSITION_R = 3.16  # au
+_TRANSITION_LOG_R = math.log10(TRANSITION_R)
+
+# sets for O(1) input validation
+_VALID_OORT_GROUPS = frozenset(OORT_GROUPS)
+_VALID_ARCS = frozenset(ORBITAL_ARCS)
+
+
+def _pars_array(orbital_arc: str, name: str) -> np.ndarray:
+    """Collect one parameter of `BRIGHTENING_PARS` across `OORT_GROUPS`."""
+    return np.array([BRIGHTENING_PARS[og][orbital_arc][name] for og in OORT_GROUPS])
+
+
+# the same parameters, one array per parameter indexed by Oort group
+K_NEAR = _pars_array("inbound", "k_near")  # inbound slope inside 3.16 au
+K_FAR = _pars_array("inbound", "k_far")  # inbound slope outside 3.16 au
+M1_IN = _pars_array("inbound", "m1")  # pre-perihelion magnitude at 1 au
+K1 = _pars_array("outbound", "k1")  # post-perihelion fading slope
+M1_OUT = _pars_array("outbound", "m1")  # post-perihelion magnitude at 1 au
+
+
+# inbound arrays at least this long are evaluated with a compiled numba kernel,
+# when numba is installed (imported and compiled on first use only)
+_NUMBA_MIN_SIZE = 10_000
+_numba_kernel_cache = None
+
+
+def _thm_inbound(log_r, k_near, k_far, m_near, tlr):
+    """Inbound magnitude for a 1-d array of log distances (numba kernel)."""
+    out = np.empty_like(log_r)
+    for i in range(log_r.size):
+        lr = log_r[i]
+        # same expression and evaluation order as the NumPy path
+        out[i] = (
+            m_near + k_near * np.minimum(lr, tlr) + k_far * np.maximum(lr - tlr, 0.0)
+        )
+    return out
+
+
+def _numba_kernel():
+    """Return the compiled inbound kernel, or None without numba."""
+    global _numba_kernel_cache
+    if _numba_kernel_cache is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _numba_kernel_cache = False
+        else:
+            # no fastmath: results must match the NumPy path bit for bit
+            _numba_kernel_cache = njit(cache=True)(_thm_inbound)
+    return _numba_kernel_cache or None
+
+
+def _total_mag_from_log_r(
+    log_r: np.ndarray, orbital_arc: str, oort_group: str
+) -> np.ndarray:
+    """Total heliocentric magnitude from an array of log distances (no validation)."""
+
+    if orbital_arc == "inbound" and log_r.size >= _NUMBA_MIN_SIZE:
+        kernel = _numba_kernel()
+        if kernel is not None:
+            i = OORT_GROUPS.index(oort_group)
+            return kernel(
+                log_r.ravel(), K_NEAR[i], K_FAR[i], M1_IN[i], _TRANSITION_LOG_R
+            ).reshape(log_r.shape)
+    # invalid groups or arcs raise in the batch core, even under python -O
+    return _total_mag_batch_from_log_r(log_r, orbital_arc, [oort_group])[..., 0]
+
+
+def _total_mag_batch_from_log_r(
+    log_r: np.ndarray, orbital_arc: str, oort_groups: Iterable[str]
+) -> np.ndarray:
+    """Batch total heliocentric magnitude from log distances (no validation)."""
+
+    group_idx = [OORT_GROUPS.index(oort_group) for oort_group in oort_groups]
+    # trailing axis indexes the Oort group
+    log_r = np.asarray(log_r)[..., None]
+
+    if orbital_arc == "inbound":
+        k_near = K_NEAR[group_idx]
+        k_far = K_FAR[group_idx]
+        m_near = M1_IN[group_idx]
+        # continuous piecewise-linear curve: slope k_near up to the transition,
+        # k_far beyond it (both pieces meet at _TRANSITION_LOG_R)
+        total_mag = (
+            m_near
+            + k_near * np.minimum(log_r, _TRANSITION_LOG_R)
+            + k_far * np.maximum(log_r - _TRANSITION_LOG_R, 0.0)
+        )
+    elif orbital_arc == "outbound":
+        total_mag = M1_OUT[group_idx] + K1[group_idx] * log_r
+    else:
+        raise ValueError(f"Invalid arc: {orbital_arc}")
+    return total_mag
+
+
+def _tabulate_curves() -> MappingProxyType:
+    """Evaluate every (orbital_arc, oort_group) curve on `CURVES_LOG_R`."""
+    curves = {}
+    for orbital_arc in ORBITAL_ARCS:
+        mags = _total_mag_batch_from_log_r(CURVES_LOG_R, orbital_arc, OORT_GROUPS)
+        for i, oort_group in enumerate(OORT_GROUPS):
+            curve = mags[:, i].copy()
+            curve.flags.writeable = False
+            curves[orbital_arc, oort_group] = curve
+    return MappingProxyType(curves)
+
+
+# precomputed light curves at log10(distance) = 0, log10(TRANSITION_R), 1, keyed
+# by (orbital_arc, oort_group); the curves are piecewise-linear in log distance,
+# so np.interp(log_r, CURVES_LOG_R, CURVES[arc, group]) is exact for 1-10 au
+CURVES_LOG_R = np.array([0.0, _TRANSITION_LOG_R, 1.0])
+CURVES_LOG_R.flags.writeable = False
+CURVES = _tabulate_curves()
+
 
 def calc_total_heliocentric_mag(
     distance: Union[float, Iterable[float]],
@@ -57,68 +212,88 @@ def calc_total_heliocentric_mag(
     Dependencies
     ------------
     numpy
+    numba (optional, speeds up large inbound array inputs)
     typing; python_version < '3.5'
     """
 
-    OORT_GROUPS = ["new", "int", "old"]
-    BRIGHTENING_PARS = {
-        "new": {
-            "inbound": {
-                "k_near": 6.7285,  # Near-Sun slope
-                "k_far": 12.847,  # Far-Sun slope
-                "m1": 8.28,  # Pre-perihelion magnitude at 1 au
-            },
-            "outbound": {
-                "k1": 11.54,  # Post-perihelion fading slope
-                "m1": 8.75,  # Post-perihelion magnitude at 1 au
-            },
-        },
-        "int": {
-            "inbound": {"k_near": 7.83575, "k_far": 12.524, "m1": 8.96},
-            "outbound": {"k1": 12.66, "m1": 9.71},
-        },
-        "old": {
-            "inbound": {"k_near": 13.40275, "k_far": 14.632, "m1": 11.58},
-            "outbound": {"k1": 13.21, "m1": 11.57},
-        },
-    }
-    # distance at which slope changes
-    TRANSITION_R = 3.16  # au
-    transition_log_r = np.log10(TRANSITION_R)
+    # validate oort_group and arc (skipped when running with python -O)
+    if __debug__:
+        if oort_group not in _VALID_OORT_GROUPS:
+            raise ValueError(f"Invalid oort group: {oort_group}")
+        if orbital_arc not in _VALID_ARCS:
+            raise ValueError(f"Invalid arc: {orbital_arc}")
 
-    # if run from CLI, read in arguments
-    if len(argv) == 4:
-        distance = float(argv[1])
-        orbital_arc = argv[2]
-        oort_group = argv[3]
-    else:
-        distance = np.asarray(distance)
-
-    # validate oort_group
-    if oort_group not in OORT_GROUPS:
-        raise ValueError(f"Invalid oort group: {oort_group}")
-    # validate arc
-    if orbital_arc not in ["inbound", "outbound"]:
-        raise ValueError(f"Invalid arc: {orbital_arc}")
+    # scalar distance: plain float arithmetic, no array/ufunc overhead
+    if isinstance(distance, (int, float, np.generic)):
+        distance = float(distance)
+        # match np.log10 for non-positive distances (-inf at 0, nan below)
+        if distance > 0:
+            log_r = math.log10(distance)
+        else:
+            log_r = -math.inf if distance == 0 else math.nan
+        # the lookup fails loudly for an invalid group or arc, even under -O
+        pars = BRIGHTENING_PARS[oort_group][orbital_arc]
+        if orbital_arc == "inbound":  # pre-perihelion
+            if log_r < _TRANSITION_LOG_R:
+                return pars["m1"] + pars["k_near"] * log_r
+            return (
+                pars["m1"]
+                + pars["k_near"] * _TRANSITION_LOG_R
+                + pars["k_far"] * (log_r - _TRANSITION_LOG_R)
+            )
+        return pars["m1"] + pars["k1"] * log_r  # post-perihelion
 
     # log distance (log_r)
-    log_r = np.log10(np.asarray(distance))
-
-    if orbital_arc == "inbound":  # pre-perihelion
-        mask = log_r < transition_log_r
-        k_near = BRIGHTENING_PARS[oort_group]["inbound"]["k_near"]
-        m_near = BRIGHTENING_PARS[oort_group]["inbound"]["m1"]
-        k_far = BRIGHTENING_PARS[oort_group]["inbound"]["k_far"]
-        m_far = m_near + transition_log_r * (k_near - k_far)
-        total_mag = np.where(mask, m_near + k_near * log_r, m_far + k_far * log_r)
-    else:  # post-perihelion
-        k = BRIGHTENING_PARS[oort_group]["outbound"]["k1"]
-        m = BRIGHTENING_PARS[oort_group]["outbound"]["m1"]
-        total_mag = m + k * log_r
-    return total_mag
+    log_r = np.log10(np.asarray(distance, dtype=np.float64))
+
+    return _total_mag_from_log_r(log_r, orbital_arc, oort_group)
+
+
+def calc_total_heliocentric_mag_batch(
+    distance: Union[float, Iterable[float]],
+    orbital_arc: str = "inbound",
+    oort_groups: Iterable[str] = OORT_GROUPS,
+) -> np.ndarray:
+    """Calculate total heliocentric magnitude for several Oort groups at once.
+
+    Vectorized counterpart of `calc_total_heliocentric_mag`: all requested Oort
+    groups are evaluated in a single pass over the parameter arrays.
+
+    Parameters
+    ----------
+    distance : float or array_like
+        Heliocentric distance in au
+    orbital_arc : {'inbound', 'outbound'}, optional
+        Orbital phase (pre/post-perihelion), default: 'inbound'
+    oort_groups : iterable of {'new', 'int', 'old'}, optional
+        Oort dynamical groups, default: all groups
+
+    Returns
+    -------
+    median_total_mag : ndarray
+        Median total heliocentric magnitude with shape
+        distance.shape + (len(oort_groups),), i.e. one column per Oort group.
+    """
+
+    oort_groups = list(oort_groups)
+    # validate oort_groups and arc (skipped when running with python -O)
+    if __debug__:
+        for oort_group in oort_groups:
+            if oort_group not in _VALID_OORT_GROUPS:
+                raise ValueError(f"Invalid oort group: {oort_group}")
+        if orbital_arc not in _VALID_ARCS:
+            raise ValueError(f"Invalid arc: {orbital_arc}")
+
+    log_r = np.log10(np.asarray(distance, dtype=np.float64))
+    return _total_mag_batch_from_log_r(log_r, orbital_arc, oort_groups)
 
 
 def main():
+    # if run from CLI with arguments, evaluate them and exit
+    if len(argv) == 4:
+        print(calc_total_heliocentric_mag(float(argv[1]), argv[2], argv[3]))
+        return
+
     print()
     print("What the function `total_heliocentric_mag` does:")
     print("-----------------------------------------------")
@@ -1,8 +1,18 @@
+import os
+
+import matplotlib
 import matplotlib.pyplot as plt
 import numpy as np
-from calc_total_heliocentric_mag import calc_total_heliocentric_mag
+from matplotlib.lines import Line2D
+from calc_total_heliocentric_mag import (
+    CURVES,
+    CURVES_LOG_R,
+    K1,
+    K_FAR,
+    K_NEAR,
+    OORT_GROUPS,
+)
 
-OORT_GROUPS = ["new", "int", "old"]
 OORT_LINESTYLES = {
     "new": {"linestyle": "-", "color": "#0C7BDC"},
     "int": {"linestyle": (0, (7, 1.5)), "color": "#FFC20A"},
@@ -22,82 +32,87 @@ def plot_heliocentric_lightcurves():
 
     Returns
     -------
-    None
+    fig : matplotlib.figure.Figure
+        The figure holding both panels
+    lines : dict
+        Light curve `Line2D` artists keyed by (orbital_arc, oort_group)
+    annotations : dict
+        Lists of slope label `Text` artists keyed by (orbital_arc, oort_group),
+        one per line segment
     """
 
-    # pre-perihelion, median, heliocentric-distance-dependent brightening slopes
-    # for [new, int. and old comets]
-    oort_gr_inbound_kr_near = [6.7285, 7.83575, 13.40275]  # inside 3.16 au
-    oort_gr_inbound_kr_far = [12.847, 12.524, 14.632]  # outside 3.16 au
-
-    # post-perihelion median global fading parameters for [new, int. and old comets]
-    oort_gr_outbound_k1 = [11.54, 12.66, 13.21]  # fading slopes
-
-    oort_groups = ["new", "int", "old"]
-    oort_labels = [OORT_GROUPS[i] for i, og in enumerate(oort_groups)]
+    # median brightening slopes (K_NEAR, K_FAR: pre-perihelion inside/outside
+    # 3.16 au; K1: post-perihelion fading) are indexed like OORT_GROUPS
+    oort_groups = OORT_GROUPS
+    oort_labels = list(oort_groups)
     oort_linestyles = [OORT_LINESTYLES[oort] for oort in oort_groups]
 
-    r = np.linspace(1, 10, 100)
-    x = np.log10(r)
-    r_near = np.linspace(3.16, 1, 100)
-    r_far = np.linspace(10, 3.16, 100)
-    x_near = np.log10(r_near)
-    x_far = np.log10(r_far)
+    # the curves are piecewise-linear in log(r), so the precomputed breakpoints
+    # (1 au, the transition distance and 10 au) represent them exactly; the
+    # straight outbound lines only need the end points
+    x_in = CURVES_LOG_R
+    x_out = CURVES_LOG_R[[0, -1]]
 
     fig, (ax_inbound, ax_outbound) = plt.subplots(1, 2, sharey=True)
 
     # no space between plot axes
     fig.subplots_adjust(wspace=0)
 
+    # annotate lines with slope value
+    annotate_opt_dict = {
+        "zorder": 2,
+        "fontsize": 9,
+        "ha": "center",
+        "va": "bottom",
+        "bbox": dict(boxstyle="round,pad=0.2", facecolor="yellow", edgecolor="black"),
+    }
+    # slope labels sit at the segment midpoints in log(r), where the curves are
+    # the mean of the segment end points
+    x_mids = np.array(
+        [(x_in[0] + x_in[1]) / 2, (x_in[1] + x_in[2]) / 2, (x_out[0] + x_out[1]) / 2]
+    )
+
+    # keep the artists so that interactive redraws can update them in place
+    lines = {}
+    annotations = {}
+
     for i, og in enumerate(oort_groups):
-        ax_inbound.plot(
-            x,
-            calc_total_heliocentric_mag(r, "inbound", og),
-            **oort_linestyles[i],
-            label=oort_labels[i],
+        y_inbound = CURVES["inbound", og]
+        y_outbound = CURVES["outbound", og][[0, -1]]
+
+        # add lines directly, bypassing the argument parsing of ax.plot
+        lines["inbound", og] = ax_inbound.add_line(
+            Line2D(x_in, y_inbound, **oort_linestyles[i], label=oort_labels[i])
         )
-        ax_outbound.plot(
-            x,
-            calc_total_heliocentric_mag(r, "outbound", og),
-            **oort_linestyles[i],
-            label=oort_labels[i],
+        lines["outbound", og] = ax_outbound.add_line(
+            Line2D(x_out, y_outbound, **oort_linestyles[i], label=oort_labels[i])
         )
 
-        # annotate lines with slope value
-        annotate_opt_dict = {
-            "zorder": 2,
-            "fontsize": 9,
-            "ha": "center",
-            "va": "bottom",
-            "backgroundcolor": "white",
-            "bbox": dict(
-                boxstyle="round,pad=0.2", facecolor="yellow", edgecolor="black"
+        annotations["inbound", og] = [
+            ax_inbound.text(
+                x_mids[0],
+                (y_inbound[0] + y_inbound[1]) / 2,
+                r"$%.1f$" % K_NEAR[i],
+                **annotate_opt_dict,
             ),
-        }
-        ax_inbound.annotate(
-            r"$%.1f$" % oort_gr_inbound_kr_near[i],
-            (
-                (x_ins_mid := (x_near[0] + x_near[-1]) / 2),
-                calc_total_heliocentric_mag(10**x_ins_mid, "inbound", og),
+            ax_inbound.text(
+                x_mids[1],
+                (y_inbound[1] + y_inbound[2]) / 2,
+                r"$%.1f$" % K_FAR[i],
+                **annotate_opt_dict,
             ),
-            **annotate_opt_dict,
-        )
-        ax_inbound.annotate(
-            r"$%.1f$" % oort_gr_inbound_kr_far[i],
-            (
-                x_out_mid := (x_far[0] + x_far[-1]) / 2,
-                calc_total_heliocentric_mag(10**x_out_mid, "inbound", og),
-            ),
-            **annotate_opt_dict,
-        )
-        ax_outbound.annotate(
-            r"$%.1f$" % oort_gr_outbound_k1[i],
-            (
-                (x_all_dist_mid := (x[0] + x[-1]) / 2),
-                calc_total_heliocentric_mag(10**x_all_dist_mid, "outbound", og),
-            ),
-            **annotate_opt_dict,
-        )
+        ]
+        annotations["outbound", og] = [
+            ax_outbound.text(
+                x_mids[2],
+                (y_outbound[0] + y_outbound[1]) / 2,
+                r"$%.1f$" % K1[i],
+                **annotate_opt_dict,
+            )
+        ]
+
+    ax_inbound.autoscale_view()
+    ax_outbound.autoscale_view()
 
     ax_inbound.set_xlabel(r"$r$ (au)")
     ax_outbound.set_xlabel(r"$r$ (au)")
@@ -123,15 +138,96 @@ def plot_heliocentric_lightcurves():
 
     plt.legend(title="Oort Group")
 
+    return fig, lines, annotations
+
+
+def _draw_lightcurve_artists(lines, annotations):
+    for key, line in lines.items():
+        line.axes.draw_artist(line)
+        for annotation in annotations[key]:
+            annotation.axes.draw_artist(annotation)
+
+
+def init_blitting(fig, lines, annotations):
+    """
+    Prepare a light curve figure for fast interactive redraws by blitting.
+
+    The light curves and their annotations are marked as animated, so the
+    rest of the figure is rendered once and cached as a background.
+
+    Parameters
+    ----------
+    fig, lines, annotations
+        As returned by `plot_heliocentric_lightcurves`
+
+    Returns
+    -------
+    background
+        Cached figure background, to be passed to `update_lightcurves`
+    """
+
+    for key, line in lines.items():
+        line.set_animated(True)
+        for annotation in annotations[key]:
+            annotation.set_animated(True)
+
+    fig.canvas.draw()
+    background = fig.canvas.copy_from_bbox(fig.bbox)
+    _draw_lightcurve_artists(lines, annotations)
+    fig.canvas.blit(fig.bbox)
+    return background
+
+
+def update_lightcurves(fig, background, lines, annotations, ydata):
+    """
+    Redraw light curves with new magnitudes without re-rendering the figure.
+
+    The slope labels are moved to the new segment midpoints and relabelled with
+    the new segment slopes.
+
+    Parameters
+    ----------
+    fig, lines, annotations
+        As returned by `plot_heliocentric_lightcurves`
+    background
+        As returned by `init_blitting`
+    ydata : dict
+        New magnitudes at the line vertices, keyed by (orbital_arc, oort_group)
+
+    Returns
+    -------
+    None
+    """
+
+    for key, y in ydata.items():
+        lines[key].set_ydata(y)
+        x = lines[key].get_xdata()
+        # annotations sit at the segment midpoints in log(r), where the
+        # piecewise-linear curve is the mean of the segment end points, and
+        # show the segment slope in mag/log(au)
+        for j, annotation in enumerate(annotations[key]):
+            annotation.set_y((y[j] + y[j + 1]) / 2)
+            annotation.set_text(r"$%.1f$" % ((y[j + 1] - y[j]) / (x[j + 1] - x[j])))
+
+    fig.canvas.restore_region(background)
+    _draw_lightcurve_artists(lines, annotations)
+    fig.canvas.blit(fig.bbox)
+
 
 def main():
 
-    plot_heliocentric_lightcurves()
+    # set LPC_PLOT_AGG=1 for non-interactive runs: the figure is rendered with
+    # the faster Agg backend and saved to file instead of shown
+    save_to_file = bool(os.environ.get("LPC_PLOT_AGG"))
+    if save_to_file:
+        matplotlib.use("Agg")
 
-    plt.show()
+    plot_heliocentric_lightcurves()
 
-    # plt.savefig("heliocentric_lightcurves.pdf", transparent=True, bbox_inches="tight")
-    # plt.savefig("heliocentric_lightcurves.png", bbox_inches="tight", dpi=300)
+    if save_to_file:
+        plt.savefig("heliocentric_lightcurves.png", bbox_inches="tight", dpi=300)
+    else:
+        plt.show()
 
 
 if __name__ == "__main__":